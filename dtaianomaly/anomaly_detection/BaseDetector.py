@@ -1,10 +1,15 @@
 import abc
 import enum
+import importlib
+import json
+import mmap
 import os.path
 import pickle
+import warnings
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
+import numba
 import numpy as np
 import scipy
 
@@ -121,8 +126,7 @@ class BaseDetector(PrettyPrintable):
 
         raw_scores = self.decision_function(X)
 
-        min_score = np.nanmin(raw_scores)
-        max_score = np.nanmax(raw_scores)
+        min_score, max_score = _nan_min_max(np.asarray(raw_scores).ravel())
         if min_score == max_score:
             if not (0.0 <= min_score <= 1.0):
                 raise ValueError(
@@ -132,7 +136,9 @@ class BaseDetector(PrettyPrintable):
             return raw_scores
 
         else:
-            return (raw_scores - min_score) / (max_score - min_score)
+            probabilities = np.subtract(raw_scores, min_score, dtype=float)
+            probabilities /= max_score - min_score
+            return probabilities
 
     def predict_confidence(
         self,
@@ -258,6 +264,116 @@ class BaseDetector(PrettyPrintable):
         with open(path, "wb") as f:
             pickle.dump(self, f)
 
+    def save_fast(self, path: Union[str, Path]) -> None:
+        """
+        Save detector to disk in a binary format with extension `.dtai`, which
+        can be loaded via :py:func:`~dtaianomaly.anomaly_detection.load_detector_fast`.
+        If the given path consists of multiple subdirectories, then the not existing
+        subdirectories are created.
+
+        The file starts with the length of a JSON-header (8 bytes, little-endian),
+        followed by the header itself and the raw bytes of all numpy arrays of this
+        detector. The header contains the class of the detector, the attributes that
+        can be represented in JSON, and the dtype, shape and offset of each array.
+        This way, the arrays can be loaded without copying and without unpickling.
+        Attributes which can not be represented in this format (e.g., fitted models
+        of other libraries) are pickled and stored as raw bytes, for which a warning
+        is raised.
+
+        Parameters
+        ----------
+        path: str or Path
+            Location where to store the detector.
+        """
+        # Add the '.dtai' extension
+        if Path(path).suffix != ".dtai":
+            path = f"{path}.dtai"
+
+        # Create the subdirectory, if it doesn't exist
+        if not os.path.exists(Path(path).parent):
+            os.makedirs(Path(path).parent)
+
+        # Split the attributes of this detector
+        header = {
+            "module": self.__class__.__module__,
+            "class": self.__class__.__qualname__,
+            "attributes": {},
+            "arrays": {},
+            "pickled": {},
+        }
+        buffers = []
+        offset = 0
+        for name, value in self.__dict__.items():
+            if isinstance(value, Supervision):
+                header["attributes"][name] = {"supervision": value.name}
+            elif _is_json_compatible(value):
+                header["attributes"][name] = {"value": value}
+            elif isinstance(value, (np.ndarray, np.generic)) and value.dtype != object:
+                buffer = np.array(value, order="C")
+                header["arrays"][name] = {
+                    "dtype": buffer.dtype.str,
+                    "shape": list(buffer.shape),
+                    "scalar": isinstance(value, np.generic),
+                    "offset": offset,
+                }
+                buffers.append(buffer)
+                offset += buffer.nbytes
+            else:
+                warnings.warn(
+                    f"Attribute '{name}' of {self.__class__.__name__} can not be stored as "
+                    f"raw bytes and is pickled instead. Only load this file if you trust it!"
+                )
+                buffer = pickle.dumps(value)
+                header["pickled"][name] = {"offset": offset, "nbytes": len(buffer)}
+                buffers.append(buffer)
+                offset += len(buffer)
+
+        # Effectively write the anomaly detector to disk
+        encoded_header = json.dumps(header).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(len(encoded_header).to_bytes(8, "little"))
+            f.write(encoded_header)
+            for buffer in buffers:
+                f.write(buffer)
+
+
+def _is_json_compatible(value) -> bool:
+    """
+    Check if the given value can be converted to JSON and back without any
+    loss of information, i.e., it is a (nested) list or string-keyed dict of
+    None, bool, int, float and str values.
+    """
+    if value is None or type(value) in (bool, int, float, str):
+        return True
+    if type(value) is list:
+        return all(_is_json_compatible(item) for item in value)
+    if type(value) is dict:
+        return all(
+            type(key) is str and _is_json_compatible(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+@numba.njit(cache=True)
+def _nan_min_max(scores: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the minimum and maximum of the given scores in a single pass,
+    while ignoring NaN-values. If all scores are NaN, then NaN is returned
+    for both the minimum and maximum.
+    """
+    min_score = np.inf
+    max_score = -np.inf
+    for score in scores:
+        if score == score:  # False if the score is NaN
+            if score < min_score:
+                min_score = score
+            if score > max_score:
+                max_score = score
+    if min_score > max_score:
+        return np.nan, np.nan
+    return min_score, max_score
+
 
 def load_detector(path: Union[str, Path]) -> BaseDetector:
     """
@@ -278,3 +394,69 @@ def load_detector(path: Union[str, Path]) -> BaseDetector:
     with open(path, "rb") as f:
         detector = pickle.load(f)
     return detector
+
+
+def load_detector_fast(path: Union[str, Path]) -> BaseDetector:
+    """
+    Load a detector from disk, which has been saved using
+    :py:meth:`~dtaianomaly.anomaly_detection.BaseDetector.save_fast`.
+
+    The file is memory-mapped, and the arrays of the detector are read-only
+    views on the memory-mapped file. Attributes which were pickled when saving
+    the detector are unpickled. Only load trusted files if the detector
+    contains pickled attributes!
+
+    Parameters
+    ----------
+    path: str or Path
+        Location of the stored detector.
+
+    Returns
+    -------
+    detector: BaseDetector
+        The loaded detector.
+
+    Raises
+    ------
+    ValueError
+        If the stored class is not a :py:class:`~dtaianomaly.anomaly_detection.BaseDetector`.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Read the header
+    header_length = int.from_bytes(buffer[:8], "little")
+    header = json.loads(buffer[8 : 8 + header_length].decode("utf-8"))
+    data_start = 8 + header_length
+
+    # Retrieve the class of the detector, without calling the constructor
+    detector_class = importlib.import_module(header["module"])
+    for name in header["class"].split("."):
+        detector_class = getattr(detector_class, name)
+    if not (
+        isinstance(detector_class, type) and issubclass(detector_class, BaseDetector)
+    ):
+        raise ValueError(f"The file '{path}' does not contain a valid detector!")
+    detector = detector_class.__new__(detector_class)
+
+    # Restore the attributes
+    for name, attribute in header["attributes"].items():
+        if "supervision" in attribute:
+            detector.__dict__[name] = Supervision[attribute["supervision"]]
+        else:
+            detector.__dict__[name] = attribute["value"]
+    for name, array in header["arrays"].items():
+        value = np.frombuffer(
+            buffer,
+            dtype=np.dtype(array["dtype"]),
+            count=int(np.prod(array["shape"])),
+            offset=data_start + array["offset"],
+        ).reshape(array["shape"])
+        detector.__dict__[name] = value[()] if array["scalar"] else value
+    for name, pickled in header["pickled"].items():
+        start = data_start + pickled["offset"]
+        detector.__dict__[name] = pickle.loads(
+            buffer[start : start + pickled["nbytes"]]
+        )
+
+    return detector
@@ -8,7 +8,7 @@ We refer to the `documentation <https://dtaianomaly.readthedocs.io/en/stable/get
 for more information regarding detecting anomalies using ``dtaianomaly``.
 """
 
-from .BaseDetector import BaseDetector, Supervision, load_detector
+from .BaseDetector import BaseDetector, Supervision, load_detector, load_detector_fast
 from .baselines import AlwaysAnomalous, AlwaysNormal, RandomDetector
 from .ClusterBasedLocalOutlierFactor import ClusterBasedLocalOutlierFactor
 from .CopulaBasedOutlierDetector import CopulaBasedOutlierDetector
@@ -37,6 +37,7 @@ __all__ = [
     "BaseDetector",
     "Supervision",
     "load_detector",
+    "load_detector_fast",
     # Sliding window
     "sliding_window",
     "reverse_sliding_window",
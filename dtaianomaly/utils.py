@@ -46,32 +46,20 @@ def is_valid_array_like(array) -> bool:
     """
     # Check for valid numpy array
     if isinstance(array, np.ndarray):
-        if array.size == 0:
-            return True
-        return (
-            np.issubdtype(array.dtype, np.number)
-            or np.issubdtype(array.dtype, np.floating)
-            or np.issubdtype(array.dtype, bool)
-        )
+        return array.size == 0 or array.dtype.kind in "biufc"
 
     # Check for numerical sequence
     if isinstance(array, Sequence) and not isinstance(array, str):
         if len(array) == 0:
             return True
 
-        if isinstance(array[0], Sequence) and not isinstance(array[0], str):
-            # Multivariate case
-            n_attributes = len(array[0])
-            return all(
-                isinstance(sample, Sequence)
-                and not isinstance(sample, str)
-                and len(sample) == n_attributes
-                and all(isinstance(item, (int, float)) for item in sample)
-                for sample in array
-            )
-        else:
-            # Univariate case
-            return all(isinstance(item, (int, float)) for item in array)
+        # Let numpy convert the sequence, which fails for inhomogeneous shapes
+        # and results in a non-numerical dtype if non-numerical values are present
+        try:
+            array = np.asarray(array)
+        except ValueError:
+            return False
+        return array.ndim <= 2 and array.dtype.kind in "biuf"
 
     # Default case
     return False
@@ -1,8 +1,10 @@
-import multiprocessing
+import copy
+import sys
 import time
 import tracemalloc
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -19,6 +21,7 @@ from dtaianomaly.workflow.utils import (
     build_pipelines,
     convert_to_list,
     convert_to_proba_metrics,
+    group_pipelines,
 )
 
 
@@ -65,11 +68,30 @@ class Workflow:
         Number of processes to run in parallel while evaluating all
         combinations.
 
+    prefer_threads: bool, default=False
+        Whether to evaluate the combinations in parallel using threads instead
+        of processes, if ``n_jobs > 1``. Threads do not need to pickle the data
+        loaders and pipelines, but only speed up the workflow if the anomaly
+        detectors release the GIL (e.g., detectors relying on numpy). Memory
+        can not be traced when using threads.
+
     trace_memory: bool, default=False
         Whether or not memory usage of each run is reported. While this
         might give additional insights into the models, their runtime
         will be higher due to additional internal bookkeeping.
 
+    memory_backend: str, default='tracemalloc'
+        How the memory usage is traced, if ``trace_memory=True``. Valid options are:
+
+        - ``'tracemalloc'``: Trace each memory allocation in python using the
+          ``tracemalloc`` module, which gives the exact peak memory usage but
+          increases the runtime.
+        - ``'rusage'``: Measure the increase of the peak resident set size of the
+          process using the ``resource`` module, which is nearly free. Because
+          the peak of the process is measured, a run which requires less memory
+          than a previous run in the same process reports no memory usage. Only
+          available on Unix platforms.
+
     error_log_path: str, default='./error_logs'
         The path in which the error logs should be saved.
 
@@ -85,7 +107,9 @@ class Workflow:
     pipelines: List[EvaluationPipeline]
     provided_preprocessors: bool
     n_jobs: int
+    prefer_threads: bool
     trace_memory: bool
+    memory_backend: str
     error_log_path: str
     fit_unsupervised_on_test_data: bool
 
@@ -97,7 +121,9 @@ class Workflow:
         preprocessors: Union[Preprocessor, List[Preprocessor]] = None,
         thresholds: Union[Thresholding, List[Thresholding]] = None,
         n_jobs: int = 1,
+        prefer_threads: bool = False,
         trace_memory: bool = False,
+        memory_backend: str = "tracemalloc",
         error_log_path: str = "./error_logs",
         fit_unsupervised_on_test_data: bool = False,
     ):
@@ -132,6 +158,12 @@ class Workflow:
             raise ValueError("At least one detectors should be given to the workflow!")
         if n_jobs < 1:
             raise ValueError("There should be at least one job within a workflow!")
+        if prefer_threads and trace_memory:
+            raise ValueError("Memory can not be traced when using threads!")
+        if memory_backend not in ["tracemalloc", "rusage"]:
+            raise ValueError(f"Invalid memory backend given: '{memory_backend}'.")
+        if memory_backend == "rusage" and sys.platform == "win32":
+            raise ValueError("The 'rusage' memory backend is not available on Windows!")
 
         # Set the properties of this workflow
         self.pipelines = build_pipelines(
@@ -139,7 +171,9 @@ class Workflow:
         )
         self.dataloaders = dataloaders
         self.n_jobs = n_jobs
+        self.prefer_threads = prefer_threads
         self.trace_memory = trace_memory
+        self.memory_backend = memory_backend
         self.error_log_path = error_log_path
         self.fit_unsupervised_on_test_data = fit_unsupervised_on_test_data
 
@@ -157,19 +191,16 @@ class Workflow:
             different evaluation metrics, running time and potentially also
             the memory usage.
         """
-        # Create all the jobs
-        unit_jobs = [
-            (dataloader, pipeline)
-            for dataloader in self.dataloaders
-            for pipeline in self.pipelines
-        ]
+        # Create all the jobs, such that each data set is loaded only once per job
+        unit_jobs = self._create_jobs()
 
         # Execute the jobs
         if self.n_jobs == 1:
-            result = [
-                _single_job(
+            grouped_result = [
+                _grouped_job(
                     *job,
                     trace_memory=self.trace_memory,
+                    memory_backend=self.memory_backend,
                     error_log_path=self.error_log_path,
                     fit_unsupervised_on_test_data=self.fit_unsupervised_on_test_data,
                 )
@@ -177,18 +208,31 @@ class Workflow:
             ]
         else:
             single_run_function = partial(
-                _single_job,
+                _grouped_job,
                 trace_memory=self.trace_memory,
+                memory_backend=self.memory_backend,
                 error_log_path=self.error_log_path,
                 fit_unsupervised_on_test_data=self.fit_unsupervised_on_test_data,
             )
-            with multiprocessing.Pool(processes=self.n_jobs) as pool:
-                result = pool.starmap(single_run_function, unit_jobs)
+            # Threads share memory, so each job must fit its own copy of the pipelines
+            if self.prefer_threads:
+                unit_jobs = [
+                    (dataloader, copy.deepcopy(pipelines))
+                    for dataloader, pipelines in unit_jobs
+                ]
+
+            # Submit the jobs in chunks to reduce the communication overhead
+            chunksize = max(1, len(unit_jobs) // (4 * self.n_jobs))
+            with self._executor() as executor:
+                grouped_result = list(
+                    executor.map(
+                        single_run_function, *zip(*unit_jobs), chunksize=chunksize
+                    )
+                )
 
-        # Create a dataframe of the results
-        results_df = pd.DataFrame(result)
+        result = [results for group in grouped_result for results in group]
 
-        # Reorder the columns
+        # Determine the columns of the results, in the correct order
         columns = [
             "Dataset",
             "Detector",
@@ -201,129 +245,297 @@ class Workflow:
             columns.extend(
                 ["Peak Memory Fit [MB]", "Peak Memory Predict [MB]", "Peak Memory [MB]"]
             )
-        results_df = results_df[
-            columns + [x for x in results_df.columns if x not in columns]
-        ]
+        columns.extend(
+            dict.fromkeys(str(metric) for metric in self.pipelines[0].metrics)
+        )
+        if any("Error file" in results for results in result):
+            columns.append("Error file")
 
         # Drop the processors column, if none were provided.
         if not self.provided_preprocessors:
-            results_df.drop(columns="Preprocessor", inplace=True)
+            columns.remove("Preprocessor")
+
+        # Create a dataframe of the results from the columns
+        results_df = pd.DataFrame(
+            {
+                column: [results.get(column, np.nan) for results in result]
+                for column in columns
+            }
+        )
 
         # Return the results
         return results_df
 
+    def _create_jobs(self) -> List[Tuple[LazyDataLoader, List[EvaluationPipeline]]]:
+        # One job per data loader, which evaluates all pipelines on the loaded data
+        if self.n_jobs == 1 or len(self.dataloaders) >= self.n_jobs:
+            return [(dataloader, self.pipelines) for dataloader in self.dataloaders]
+        # Too few data loaders to keep all workers busy: split the jobs further
+        # such that pipelines with the same preprocessor share a job
+        return [
+            (dataloader, pipelines)
+            for dataloader in self.dataloaders
+            for pipelines in group_pipelines(self.pipelines)
+        ]
+
+    def _executor(self) -> Executor:
+        if self.prefer_threads:
+            return ThreadPoolExecutor(max_workers=self.n_jobs)
+        return ProcessPoolExecutor(
+            max_workers=self.n_jobs, initializer=_initialize_worker
+        )
 
-def _single_job(
+
+def _initialize_worker() -> None:
+    # Import the anomaly detectors once per worker, instead of for each job
+    import dtaianomaly.anomaly_detection  # noqa: F401
+
+
+def _grouped_job(
     dataloader: LazyDataLoader,
-    pipeline: EvaluationPipeline,
+    pipelines: List[EvaluationPipeline],
     trace_memory: bool,
+    memory_backend: str,
     error_log_path: str,
     fit_unsupervised_on_test_data: bool,
-) -> Dict[str, Union[str, float]]:
+) -> List[Dict[str, Union[str, float]]]:
+    """
+    Evaluate the given pipelines on the data of the given data loader. The
+    data is loaded only once, and it is preprocessed only once for each
+    preprocessor and possible train set. The resources required for
+    preprocessing are added to the resources of each anomaly detector.
+    """
     # Initialize the results, and by default everything went wrong ('Error')
-    results = {"Dataset": str(dataloader)}
-    for key in pipeline.metrics + [
-        "Detector",
-        "Preprocessor",
-        "Runtime Fit [s]",
-        "Runtime Predict [s]",
-        "Runtime [s]",
-    ]:
-        results[str(key)] = "Error"
-    if trace_memory:
-        for key in [
-            "Peak Memory Fit [MB]",
-            "Peak Memory Predict [MB]",
-            "Peak Memory [MB]",
+    groups = group_pipelines(pipelines)
+    all_results = []
+    for pipeline in [pipeline for group in groups for pipeline in group]:
+        results = {"Dataset": str(dataloader)}
+        for key in pipeline.metrics + [
+            "Detector",
+            "Preprocessor",
+            "Runtime Fit [s]",
+            "Runtime Predict [s]",
+            "Runtime [s]",
         ]:
-            results[key] = "Error"
+            results[str(key)] = "Error"
+        if trace_memory:
+            for key in [
+                "Peak Memory Fit [MB]",
+                "Peak Memory Predict [MB]",
+                "Peak Memory [MB]",
+            ]:
+                results[key] = "Error"
+        all_results.append(results)
 
     # Try to load the data set, if this fails, return the results
     try:
         data_set = dataloader.load()
     except Exception as exception:
-        results["Error file"] = log_error(error_log_path, exception, dataloader)
-        return results
-
-    # We can already save the used preprocessor and detector
-    results["Preprocessor"] = str(pipeline.pipeline.preprocessor)
-    results["Detector"] = str(pipeline.pipeline.detector)
-
-    # Check if the dataset and the anomaly detector are compatible
-    if not data_set.is_compatible(pipeline.pipeline):
-        error_message = (
-            f"Not compatible: detector with supervision {pipeline.pipeline.supervision} "
-            f"for data set with compatible supervision ["
+        error_file = log_error(error_log_path, exception, dataloader)
+        for results in all_results:
+            results["Error file"] = error_file
+        return all_results
+
+    # Evaluate the pipelines of each preprocessor
+    group_results = iter(all_results)
+    for group in groups:
+        _evaluate_group(
+            dataloader,
+            data_set,
+            group,
+            [next(group_results) for _ in group],
+            trace_memory,
+            memory_backend,
+            error_log_path,
+            fit_unsupervised_on_test_data,
         )
-        error_message += ", ".join([str(s) for s in data_set.compatible_supervision()])
-        error_message += "]"
-        for key, value in results.items():
-            if value == "Error":
-                results[key] = error_message
-        return results
-
-    # Format X_train, y_train, X_test and y_test
-    X_test, y_test, X_train, y_train, fit_on_X_train = _get_train_test_data(
-        data_set, pipeline.pipeline, fit_unsupervised_on_test_data
-    )
 
-    # Run the anomaly detector, and catch any exceptions
-    try:
-        # Fitting
-        _start_tracing_memory(trace_memory)
-        start = _start_tracing_runtime()
-        pipeline.fit(X_train, y_train)
-        results["Runtime Fit [s]"] = _end_tracing_runtime(start)
-        _end_tracing_memory(trace_memory, results, "Peak Memory Fit [MB]")
-
-        # Predicting
-        _start_tracing_memory(trace_memory)
-        start = _start_tracing_runtime()
-        y_pred = pipeline.predict(X_test)
-        results["Runtime Predict [s]"] = _end_tracing_runtime(start)
-        _end_tracing_memory(trace_memory, results, "Peak Memory Predict [MB]")
-
-        # Scoring
-        y_test_ = pipeline.format_y_test(X_test, y_test)
-        results.update(pipeline.evaluate(y_test_, y_pred))
-
-        # Aggregate the used resources
-        results["Runtime [s]"] = (
-            results["Runtime Fit [s]"] + results["Runtime Predict [s]"]
+    return all_results
+
+
+def _evaluate_group(
+    dataloader: LazyDataLoader,
+    data_set: DataSet,
+    pipelines: List[EvaluationPipeline],
+    all_results: List[Dict[str, Union[str, float]]],
+    trace_memory: bool,
+    memory_backend: str,
+    error_log_path: str,
+    fit_unsupervised_on_test_data: bool,
+) -> None:
+    # The preprocessed data, depending on whether the train data is used for fitting
+    preprocessed_data = {}
+
+    for pipeline, results in zip(pipelines, all_results):
+
+        # We can already save the used preprocessor and detector
+        results["Preprocessor"] = str(pipeline.pipeline.preprocessor)
+        results["Detector"] = str(pipeline.pipeline.detector)
+
+        # Check if the dataset and the anomaly detector are compatible
+        if not data_set.is_compatible(pipeline.pipeline):
+            error_message = (
+                f"Not compatible: detector with supervision {pipeline.pipeline.supervision} "
+                f"for data set with compatible supervision ["
+            )
+            error_message += ", ".join(
+                [str(s) for s in data_set.compatible_supervision()]
+            )
+            error_message += "]"
+            for key, value in results.items():
+                if value == "Error":
+                    results[key] = error_message
+            continue
+
+        # Format X_train, y_train, X_test and y_test
+        X_test, y_test, X_train, y_train, fit_on_X_train = _get_train_test_data(
+            data_set, pipeline.pipeline, fit_unsupervised_on_test_data
         )
-        if trace_memory:
-            results["Peak Memory [MB]"] = max(
-                results["Peak Memory Fit [MB]"], results["Peak Memory Predict [MB]"]
+
+        # Run the anomaly detector, and catch any exceptions
+        try:
+            # Preprocessing, if not done yet for this train data
+            if fit_on_X_train not in preprocessed_data:
+                preprocessed_data[fit_on_X_train] = _preprocess(
+                    pipeline.pipeline.preprocessor,
+                    X_test,
+                    y_test,
+                    X_train,
+                    y_train,
+                    trace_memory,
+                    memory_backend,
+                )
+            preprocessed = preprocessed_data[fit_on_X_train]
+            detector = pipeline.pipeline.detector
+
+            # Fitting
+            start_memory = _start_tracing_memory(trace_memory, memory_backend)
+            start = _start_tracing_runtime()
+            detector.fit(preprocessed["X_train"], preprocessed["y_train"])
+            results["Runtime Fit [s]"] = _end_tracing_runtime(start)
+            _end_tracing_memory(
+                trace_memory,
+                memory_backend,
+                start_memory,
+                results,
+                "Peak Memory Fit [MB]",
             )
 
-    except Exception as exception:
-        # Log the errors
-        results["Error file"] = log_error(
-            error_log_path, exception, dataloader, pipeline.pipeline, fit_on_X_train
-        )
+            # Predicting
+            start_memory = _start_tracing_memory(trace_memory, memory_backend)
+            start = _start_tracing_runtime()
+            y_pred = detector.predict_proba(preprocessed["X_test"])
+            results["Runtime Predict [s]"] = _end_tracing_runtime(start)
+            _end_tracing_memory(
+                trace_memory,
+                memory_backend,
+                start_memory,
+                results,
+                "Peak Memory Predict [MB]",
+            )
+
+            # Scoring
+            results.update(pipeline.evaluate(preprocessed["y_test"], y_pred))
+
+            # Aggregate the used resources, including those for preprocessing
+            for key in ["Runtime Fit [s]", "Runtime Predict [s]"]:
+                results[key] += preprocessed[key]
+            results["Runtime [s]"] = (
+                results["Runtime Fit [s]"] + results["Runtime Predict [s]"]
+            )
+            if trace_memory:
+                for key in ["Peak Memory Fit [MB]", "Peak Memory Predict [MB]"]:
+                    results[key] = max(results[key], preprocessed[key])
+                results["Peak Memory [MB]"] = max(
+                    results["Peak Memory Fit [MB]"],
+                    results["Peak Memory Predict [MB]"],
+                )
+
+        except Exception as exception:
+            # Log the errors
+            results["Error file"] = log_error(
+                error_log_path, exception, dataloader, pipeline.pipeline, fit_on_X_train
+            )
+
+
+def _preprocess(
+    preprocessor: Preprocessor,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    X_train: np.ndarray,
+    y_train: Optional[np.ndarray],
+    trace_memory: bool,
+    memory_backend: str,
+) -> Dict[str, Union[np.ndarray, float]]:
+    """
+    Fit the preprocessor on the train data and transform both the train and
+    test data. The resources for fitting and transforming the train data are
+    reported as 'Fit', those for transforming the test data as 'Predict'.
+    """
+    preprocessed = {}
+
+    start_memory = _start_tracing_memory(trace_memory, memory_backend)
+    start = _start_tracing_runtime()
+    preprocessed["X_train"], preprocessed["y_train"] = preprocessor.fit_transform(
+        X_train, y_train
+    )
+    preprocessed["Runtime Fit [s]"] = _end_tracing_runtime(start)
+    _end_tracing_memory(
+        trace_memory, memory_backend, start_memory, preprocessed, "Peak Memory Fit [MB]"
+    )
+
+    start_memory = _start_tracing_memory(trace_memory, memory_backend)
+    start = _start_tracing_runtime()
+    preprocessed["X_test"], preprocessed["y_test"] = preprocessor.transform(
+        X_test, y_test
+    )
+    preprocessed["Runtime Predict [s]"] = _end_tracing_runtime(start)
+    _end_tracing_memory(
+        trace_memory,
+        memory_backend,
+        start_memory,
+        preprocessed,
+        "Peak Memory Predict [MB]",
+    )
 
-    # Return the results
-    return results
+    return preprocessed
 
 
-def _start_tracing_runtime() -> float:
-    return time.time()
+def _start_tracing_runtime() -> int:
+    return time.perf_counter_ns()
 
 
-def _end_tracing_runtime(start_time: float) -> float:
-    return time.time() - start_time
+def _end_tracing_runtime(start_time: int) -> float:
+    return (time.perf_counter_ns() - start_time) / 10**9
 
 
-def _start_tracing_memory(trace_memory: bool) -> None:
+def _start_tracing_memory(trace_memory: bool, memory_backend: str) -> float:
     if trace_memory:
+        if memory_backend == "rusage":
+            return _peak_resident_set_size()
         tracemalloc.start()
+    return 0.0
 
 
-def _end_tracing_memory(trace_memory: bool, results, key) -> None:
+def _end_tracing_memory(
+    trace_memory: bool, memory_backend: str, start_memory: float, results, key
+) -> None:
     if trace_memory:
-        _, peak = tracemalloc.get_traced_memory()
-        results[key] = peak / 10**6
-        tracemalloc.stop()
+        if memory_backend == "rusage":
+            results[key] = (_peak_resident_set_size() - start_memory) / 10**6
+        else:
+            _, peak = tracemalloc.get_traced_memory()
+            results[key] = peak / 10**6
+            tracemalloc.stop()
+
+
+def _peak_resident_set_size() -> float:
+    """The peak resident set size of this process, in bytes."""
+    import resource  # Not available on Windows
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak resident set size in kilobytes, macOS in bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
 
 
 def _get_train_test_data(
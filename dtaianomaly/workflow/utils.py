@@ -24,6 +24,16 @@ def build_pipelines(
     ]
 
 
+def group_pipelines(
+    pipelines: List[EvaluationPipeline],
+) -> List[List[EvaluationPipeline]]:
+    """Group the pipelines with an equal preprocessor, while maintaining the order."""
+    groups: Dict[str, List[EvaluationPipeline]] = {}
+    for pipeline in pipelines:
+        groups.setdefault(str(pipeline.pipeline.preprocessor), []).append(pipeline)
+    return list(groups.values())
+
+
 def convert_to_proba_metrics(
     metrics: List[Metric], thresholds: List[Thresholding]
 ) -> List[ProbaMetric]:
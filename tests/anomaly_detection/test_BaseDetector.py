@@ -3,7 +3,7 @@ import os
 import pytest
 import numpy as np
 
-from dtaianomaly.anomaly_detection import BaseDetector, load_detector, baselines, Supervision
+from dtaianomaly.anomaly_detection import BaseDetector, load_detector, load_detector_fast, baselines, Supervision, MatrixProfileDetector, IsolationForest
 from dtaianomaly import utils
 
 
@@ -19,6 +19,18 @@ class InvalidConstantDecisionFunctionForPredictProba(BaseDetector):
         return np.ones(X.shape[0]) * 50
 
 
+class NaNDecisionFunctionDetector(BaseDetector):
+
+    def __init__(self):
+        super().__init__(Supervision.UNSUPERVISED)
+
+    def fit(self, X, y=None):
+        return self
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return np.array([2.0, np.nan, 4.0, 6.0, 3.0])
+
+
 class NoDefinedSupervisionDetector(BaseDetector):
 
     def fit(self, X, y=None):
@@ -63,6 +75,23 @@ class TestBaseDetector:
         with pytest.raises(ValueError):
             detector.predict_proba(data)
 
+    def test_proba_min_max_scaling(self):
+        data = np.random.standard_normal((50,))
+        detector = baselines.RandomDetector(seed=42)
+        decision_scores = detector.decision_function(data)
+        probas = detector.predict_proba(data)
+        expected = (decision_scores - decision_scores.min()) / (decision_scores.max() - decision_scores.min())
+        assert np.allclose(probas, expected)
+        assert probas.min() == 0.0
+        assert probas.max() == 1.0
+
+    def test_proba_nan_scores(self):
+        data = np.random.standard_normal((5,))
+        detector = NaNDecisionFunctionDetector()
+        probas = detector.predict_proba(data)
+        assert np.isnan(probas[1])
+        assert np.allclose(np.delete(probas, 1), [0.0, 0.5, 1.0, 0.25])
+
     def test_proba_invalid(self):
         invalid_data = None
         detector = baselines.RandomDetector()
@@ -91,6 +120,36 @@ class TestBaseDetector:
         data = np.random.standard_normal((50,))
         _ = loaded_detector.predict_proba(data)
 
+    def test_save_fast_and_load(self, tmp_path):
+        detector = baselines.RandomDetector(seed=42)
+        detector.save_fast(tmp_path / 'testing')
+        loaded_detector = load_detector_fast(tmp_path / 'testing.dtai')
+        assert isinstance(loaded_detector, baselines.RandomDetector)
+        assert detector.__dict__ == loaded_detector.__dict__
+
+        data = np.random.standard_normal((50,))
+        assert np.array_equal(detector.predict_proba(data), loaded_detector.predict_proba(data))
+
+    def test_save_fast_invalid_path(self, tmp_path):
+        detector = baselines.RandomDetector()
+        detector.save_fast(tmp_path / 'some' / 'invalid' / 'directory' / 'testing')
+        assert os.path.exists(tmp_path / 'some' / 'invalid' / 'directory' / 'testing.dtai')
+
+    def test_save_fast_and_load_arrays(self, tmp_path, univariate_time_series):
+        detector = MatrixProfileDetector(window_size='fft', novelty=True).fit(univariate_time_series)
+        detector.save_fast(tmp_path / 'testing')
+        loaded_detector = load_detector_fast(tmp_path / 'testing.dtai')
+        assert loaded_detector.window_size_ == detector.window_size_
+        assert np.array_equal(loaded_detector.X_reference_, detector.X_reference_)
+        assert np.array_equal(detector.decision_function(univariate_time_series), loaded_detector.decision_function(univariate_time_series))
+
+    def test_save_fast_and_load_pickled_attributes(self, tmp_path, univariate_time_series):
+        detector = IsolationForest(window_size=16).fit(univariate_time_series)
+        with pytest.warns(UserWarning):
+            detector.save_fast(tmp_path / 'testing')
+        loaded_detector = load_detector_fast(tmp_path / 'testing.dtai')
+        assert np.array_equal(detector.decision_function(univariate_time_series), loaded_detector.decision_function(univariate_time_series))
+
     def test_str(self):
         assert str(baselines.RandomDetector()) == 'RandomDetector()'
         assert str(baselines.AlwaysNormal()) == 'AlwaysNormal()'
@@ -119,6 +119,30 @@ class TestIsValidArrayLike:
     def test_invalid_multivariate_list_first_non_list(self):
         assert not is_valid_array_like([1, [2], [3], [4], [5]])
 
+    def test_valid_np_array_float32(self):
+        assert is_valid_array_like(np.array([1.9, 2.8, 3.7], dtype=np.float32))
+
+    def test_valid_np_array_unsigned_int(self):
+        assert is_valid_array_like(np.array([1, 2, 3], dtype=np.uint8))
+
+    def test_invalid_np_array_object(self):
+        assert not is_valid_array_like(np.array([1, 2, None]))
+
+    def test_valid_tuple(self):
+        assert is_valid_array_like((1, 2.5, 3, True))
+
+    def test_valid_list_numpy_scalars(self):
+        assert is_valid_array_like([np.int64(1), np.float32(2.5), np.bool_(True)])
+
+    def test_invalid_list_complex(self):
+        assert not is_valid_array_like([1, 2, 3j])
+
+    def test_invalid_list_none(self):
+        assert not is_valid_array_like([1, 2, None])
+
+    def test_invalid_list_three_dimensions(self):
+        assert not is_valid_array_like([[[1, 10]], [[2, 20]], [[3, 30]]])
+
 
 class TestIsUnivariate:
 
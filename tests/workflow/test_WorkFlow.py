@@ -1,4 +1,5 @@
 
+import sys
 import pytest
 import numpy as np
 
@@ -129,6 +130,31 @@ class TestWorkflowInitialization:
             trace_memory=True
         )
 
+    def test_threads_and_trace_memory(self, tmp_path_factory):
+        with pytest.raises(ValueError):
+            Workflow(
+                dataloaders=[
+                    UCRLoader(path=str(tmp_path_factory.mktemp('some-path-1'))),
+                ],
+                metrics=[AreaUnderROC()],
+                detectors=[IsolationForest(15)],
+                n_jobs=4,
+                prefer_threads=True,
+                trace_memory=True
+            )
+
+    def test_invalid_memory_backend(self, tmp_path_factory):
+        with pytest.raises(ValueError):
+            Workflow(
+                dataloaders=[
+                    UCRLoader(path=str(tmp_path_factory.mktemp('some-path-1'))),
+                ],
+                metrics=[AreaUnderROC()],
+                detectors=[IsolationForest(15)],
+                trace_memory=True,
+                memory_backend='something-invalid'
+            )
+
     def test_invalid_nb_jobs(self, tmp_path_factory):
         with pytest.raises(ValueError):
             Workflow(
@@ -151,6 +177,26 @@ class DummyDataLoader(LazyDataLoader):
         return DataSet(X, y)
 
 
+class CountingDataLoader(LazyDataLoader):
+    nb_loads = 0
+
+    def _load(self) -> DataSet:
+        CountingDataLoader.nb_loads += 1
+        X, y = demonstration_time_series()
+        return DataSet(X, y)
+
+
+class CountingPreprocessor(Preprocessor):
+    nb_fits = 0
+
+    def _fit(self, X, y=None):
+        CountingPreprocessor.nb_fits += 1
+        return self
+
+    def _transform(self, X, y=None):
+        return X, y
+
+
 class TestWorkflowSuccess:
 
     def test(self, tmp_path_factory):
@@ -219,6 +265,47 @@ class TestWorkflowSuccess:
         assert results.columns[4] == 'Runtime Predict [s]'
         assert results.columns[5] == 'Runtime [s]'
 
+    def test_load_and_preprocess_once(self, tmp_path_factory):
+        CountingDataLoader.nb_loads = 0
+        CountingPreprocessor.nb_fits = 0
+        workflow = Workflow(
+            dataloaders=[
+                CountingDataLoader(path=str(tmp_path_factory.mktemp('some-path-1'))),
+            ],
+            metrics=[AreaUnderROC()],
+            preprocessors=[CountingPreprocessor(), StandardScaler()],
+            detectors=[LocalOutlierFactor(15), IsolationForest(15), MatrixProfileDetector(15)],
+            n_jobs=1,
+        )
+        results = workflow.run()
+        assert results.shape == (6, 7)
+        assert not np.any(results == 'Error')
+        assert CountingDataLoader.nb_loads == 1
+        assert CountingPreprocessor.nb_fits == 1
+
+    def test_parallel_threads(self, tmp_path_factory):
+        path = str(tmp_path_factory.mktemp('some-path-1'))
+        workflow = Workflow(
+            dataloaders=[
+                DummyDataLoader(path=path),
+                DummyDataLoader(path=path),
+            ],
+            metrics=[Precision(), Recall(), AreaUnderROC()],
+            thresholds=[TopN(10), FixedCutoff(0.5)],
+            preprocessors=[Identity(), StandardScaler()],
+            detectors=[LocalOutlierFactor(15), IsolationForest(15)],
+            n_jobs=4,
+            prefer_threads=True,
+            trace_memory=False
+        )
+        results = workflow.run()
+        assert results.shape == (8, 11)
+        assert results['Dataset'].value_counts()[f"DummyDataLoader(path='{path}')"] == 8
+        assert results['Detector'].value_counts()['LocalOutlierFactor(window_size=15)'] == 4
+        assert results['Detector'].value_counts()['IsolationForest(window_size=15)'] == 4
+        assert not np.any(results == 'Error')
+        assert not results.isna().any().any()
+
     def test_trace_memory(self, tmp_path_factory):
         path = str(tmp_path_factory.mktemp('some-path-1'))
         workflow = Workflow(
@@ -255,6 +342,28 @@ class TestWorkflowSuccess:
         assert results.columns[7] == 'Peak Memory Predict [MB]'
         assert results.columns[8] == 'Peak Memory [MB]'
 
+    @pytest.mark.skipif(sys.platform == 'win32', reason="'rusage' is not available on Windows")
+    def test_trace_memory_rusage(self, tmp_path_factory):
+        path = str(tmp_path_factory.mktemp('some-path-1'))
+        workflow = Workflow(
+            dataloaders=[
+                DummyDataLoader(path=path),
+            ],
+            metrics=[AreaUnderROC()],
+            preprocessors=[Identity(), StandardScaler()],
+            detectors=[LocalOutlierFactor(15), IsolationForest(15)],
+            n_jobs=1,
+            trace_memory=True,
+            memory_backend='rusage'
+        )
+        results = workflow.run()
+        assert results.shape == (4, 10)
+        assert not np.any(results == 'Error')
+        assert not results.isna().any().any()
+        assert (results['Peak Memory Fit [MB]'] >= 0).all()
+        assert (results['Peak Memory Predict [MB]'] >= 0).all()
+        assert (results['Peak Memory [MB]'] >= 0).all()
+
     def test_no_preprocessors(self, tmp_path_factory, univariate_time_series):
         path = str(tmp_path_factory.mktemp('some-path-1'))
         workflow = Workflow(
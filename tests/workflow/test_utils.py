@@ -3,7 +3,7 @@ from dtaianomaly.anomaly_detection import IsolationForest, LocalOutlierFactor
 from dtaianomaly.evaluation import AreaUnderROC, Precision, ThresholdMetric
 from dtaianomaly.thresholding import FixedCutoff, ContaminationRate
 from dtaianomaly.preprocessing import Identity, StandardScaler, ChainedPreprocessor
-from dtaianomaly.workflow.utils import build_pipelines, convert_to_proba_metrics, convert_to_list
+from dtaianomaly.workflow.utils import build_pipelines, convert_to_proba_metrics, convert_to_list, group_pipelines
 
 
 class TestBuildPipelines:
@@ -58,6 +58,39 @@ class TestBuildPipelines:
         assert sum(isinstance(pipeline.pipeline.preprocessor, ChainedPreprocessor) for pipeline in pipelines) == 2
 
 
+class TestGroupPipelines:
+
+    def test(self):
+        pipelines = build_pipelines(
+            preprocessors=[Identity(), StandardScaler()],
+            detectors=[IsolationForest(15), LocalOutlierFactor(15)],
+            metrics=[AreaUnderROC()]
+        )
+        groups = group_pipelines(pipelines)
+        assert len(groups) == 2
+        assert groups[0] == pipelines[:2]
+        assert groups[1] == pipelines[2:]
+
+    def test_equal_preprocessors(self):
+        pipelines = build_pipelines(
+            preprocessors=[StandardScaler(), Identity(), StandardScaler()],
+            detectors=[IsolationForest(15)],
+            metrics=[AreaUnderROC()]
+        )
+        groups = group_pipelines(pipelines)
+        assert len(groups) == 2
+        assert groups[0] == [pipelines[0], pipelines[2]]
+        assert groups[1] == [pipelines[1]]
+
+    def test_list_of_preprocessors(self):
+        pipelines = build_pipelines(
+            preprocessors=[[StandardScaler(), Identity()]],
+            detectors=[IsolationForest(15), LocalOutlierFactor(15)],
+            metrics=[AreaUnderROC()]
+        )
+        assert len(group_pipelines(pipelines)) == 1
+
+
 class TestConvertToProbaMetrics:
 
     def test(self):